@@ -39,13 +39,68 @@ Author: [Your Name]
 
 import os
 import sys
+import pickle
+import tempfile
+from functools import lru_cache
 from typing import Any, Dict
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 def _load_yaml(path: str) -> Any:
-    """Load a YAML file and return its contents."""
+    """
+    Load a YAML file and return its contents.
+    The parsed data is cached next to the source as <path>.pkl, tagged with
+    the source's (mtime_ns, size), and reused only while both match exactly.
+    """
+    cache_path = path + ".pkl"
+    st = os.stat(path)
+    source_key = (st.st_mtime_ns, st.st_size)
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == source_key:
+            return data
+    except Exception:
+        pass  # Missing, stale-format or unreadable cache; parse the YAML below
+
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Write to a private temp file first so a partial cache is never picked
+    # up and concurrent runs don't clobber each other's writes
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path) or ".",
+            prefix=os.path.basename(cache_path) + ".",
+            suffix=".tmp",
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((source_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only location or failed write; caching is best-effort
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return data
+
+@lru_cache(maxsize=None)
+def _type_from_suffix(suffix: str) -> str:
+    """
+    Map a slot-name suffix to its cell type, e.g. R0_NAND_0 → "NAND".
+    Memoized, since every tile repeats the same handful of suffixes.
+    """
+    parts = suffix.split("_")
+    # Remove row prefix if present (e.g. R0_NAND_0)
+    # Interned so every slot of a type shares one string object
+    if len(parts) >= 2 and parts[0].startswith("R"):
+        return sys.intern(parts[1])
+    return sys.intern(parts[0])
 
 def _infer_cell_type(slot_name: str) -> str:
     """
@@ -53,13 +108,7 @@ def _infer_cell_type(slot_name: str) -> str:
     E.g. T0Y0__R0_NAND_0 → "NAND"
     """
     # Example: T0Y0__R0_NAND_0
-    parts = slot_name.split("__")[-1].split("_")
-    # Remove row prefix if present (e.g. R0_NAND_0)
-    if len(parts) >= 2 and parts[0].startswith("R"):
-        return parts[1]
-    elif len(parts) >= 1:
-        return parts[0]
-    return slot_name
+    return _type_from_suffix(slot_name.split("__")[-1])
 
 def _build_cells_by_type(slots: Dict[str, dict]) -> Dict[str, list]:
     """Build a mapping from cell_type to list of slot_names."""
@@ -96,7 +145,9 @@ def load_fabric_db(
             seen_slot_names.add(slot_name)
             # Try to infer type from slot name, but allow override if present
             cell_type = _infer_cell_type(slot_name)
-            slot = {
+            # Keep every field of the cell entry; the explicit keys win
+            slots[slot_name] = {
+                **cell,
                 "type": cell_type,
                 "x": cell.get("x"),
                 "y": cell.get("y"),
@@ -105,11 +156,6 @@ def load_fabric_db(
                 "tile_x": tile_x,
                 "tile_y": tile_y,
             }
-            # Add any other fields present in the cell entry
-            for k, v in cell.items():
-                if k not in slot:
-                    slot[k] = v
-            slots[slot_name] = slot
 
     # --- Build cells_by_type ---
     cells_by_type = _build_cells_by_type(slots)
@@ -130,7 +176,9 @@ def load_fabric_db(
         # Use x_um/y_um if present, else x/y
         x = pin.get("x_um", pin.get("x"))
         y = pin.get("y_um", pin.get("y"))
-        pin_entry = {
+        # Keep every field of the pin entry; the normalized keys win
+        pins[pin_name] = {
+            **pin,
             "x": x,
             "y": y,
             "direction": direction,
@@ -138,11 +186,6 @@ def load_fabric_db(
             "layer": pin.get("layer"),
             "status": pin.get("status"),
         }
-        # Add any other fields present in the pin entry
-        for k, v in pin.items():
-            if k not in pin_entry:
-                pin_entry[k] = v
-        pins[pin_name] = pin_entry
 
     # --- Optionally parse bounds ---
     bounds = None
@@ -10,17 +10,23 @@ Creates a visual map of the Structured ASIC layout:
 • Saves the image as build/fabric_view.png
 
 Usage:
-    python src/fabric_viewer.py ../fabric
+    python src/fabric_viewer.py ../fabric [dpi]
+
+dpi defaults to 150; pass 300 for print-quality output.
 """
 
 import os
 import sys
+import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
-from parse_fabric import load_fabric_db
+from Parse_Fabric import load_fabric_db
 
 
-def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_view.png"):
+def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_view.png",
+                         dpi: int = 150):
     # === Load layout data ===
     cells_file = os.path.join(fabric_folder, "fabric_cells.yaml")
     pins_file = os.path.join(fabric_folder, "pins.yaml")
@@ -32,8 +38,11 @@ def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_vi
 
     # === Setup plot ===
     cell_types = sorted({slot.get("type", "UNKNOWN") for slot in slots.values()})
-    cmap = plt.colormaps.get_cmap("tab20", len(cell_types))
+    cmap = plt.colormaps["tab20"].resampled(len(cell_types))
     color_map = {ctype: cmap(i) for i, ctype in enumerate(cell_types)}
+    # RGBA lookup table indexed by type code, so slot colors are one gather
+    type_to_idx = {ctype: i for i, ctype in enumerate(cell_types)}
+    type_colors = np.array([color_map[t] for t in cell_types])
 
     fig, ax = plt.subplots(figsize=(10, 10))
 
@@ -47,6 +56,10 @@ def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_vi
         ))
 
     # === Draw slot grid ===
+    # Slots are gathered into one PatchCollection: a single artist draws far
+    # faster than one add_patch() per slot on large fabrics.
+    slot_rects = []
+    slot_type_idx = []
     invalid_count = 0
     for name, slot in slots.items():
         x, y = slot.get("x"), slot.get("y")
@@ -55,21 +68,30 @@ def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_vi
             continue
 
         ctype = slot.get("type", "UNKNOWN")
-        color = color_map.get(ctype, (0.5, 0.5, 0.5, 0.3))
-        ax.add_patch(Rectangle((x - 0.5, y - 0.5), 1, 1, color=color, alpha=0.4))
+        slot_rects.append(Rectangle((x - 0.5, y - 0.5), 1, 1))
+        slot_type_idx.append(type_to_idx[ctype])
+
+    slot_colors = type_colors[np.array(slot_type_idx, dtype=np.intp)].reshape(-1, 4)
+    ax.add_collection(PatchCollection(
+        slot_rects, facecolors=slot_colors, edgecolors=slot_colors, alpha=0.4
+    ))
 
     if invalid_count:
         print(f" Ignored {invalid_count} slots with invalid coordinates")
 
     # === Mark and label pins ===
+    # Pin dots go through one scatter call instead of one Line2D per pin.
+    pin_xs, pin_ys = [], []
     for pname, pin in pins.items():
         x, y = pin.get("x"), pin.get("y")
         if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
             continue
-        ax.plot(x, y, "ro", markersize=5)
+        pin_xs.append(x)
+        pin_ys.append(y)
         ax.text(x, y, pname, fontsize=6, color="red",
                 ha="center", va="center",
                 bbox=dict(facecolor="white", alpha=0.6, edgecolor="none"))
+    ax.scatter(pin_xs, pin_ys, c="red", s=25)
 
     # === Final plot settings ===
     ax.set_aspect("equal")
@@ -87,15 +109,30 @@ def render_fabric_layout(fabric_folder: str, output_file: str = "build/fabric_vi
     # === Save image ===
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300)
-    plt.close()
+    plt.savefig(output_file, dpi=dpi)
+    plt.close(fig)
     print(f" Fabric layout saved successfully at {output_file}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python src/fabric_viewer.py <fabric_folder>")
+    usage = "Usage: python src/fabric_viewer.py <fabric_folder> [dpi]"
+    if len(sys.argv) not in (2, 3):
+        print(usage)
         sys.exit(1)
 
     folder = sys.argv[1]
-    render_fabric_layout(folder)
+    dpi = 150
+    if len(sys.argv) == 3:
+        try:
+            dpi = int(sys.argv[2])
+        except ValueError:
+            dpi = 0
+        if dpi <= 0:
+            print(f"Error: dpi must be a positive integer, got '{sys.argv[2]}'")
+            print(usage)
+            sys.exit(1)
+
+    # Run as a script we only write a PNG, so skip interactive backend setup.
+    # Importers keep whatever backend they already chose.
+    matplotlib.use("Agg")
+    render_fabric_layout(folder, dpi=dpi)
@@ -3,10 +3,12 @@ parse_design.py
 
 Phase 1 - Step 2: Logical Design Netlist Parser for Structured ASIC Project
 
-This module provides a single public function, `load_logical_db`, which parses
-a mapped JSON design file and constructs a logical_db dictionary describing the
+This module provides two public functions for parsing a mapped JSON design
+file. `load_logical_db` constructs a logical_db dictionary describing the
 logical design: all instances and nets. This is the canonical source of logical
 netlist information for all later project phases (validation, placement, etc).
+`load_cell_counts` returns only the cell_count_by_type mapping, without
+building instances or nets, for callers that just need per-type counts.
 
 logical_db structure:
 - logical_db["instances"]: dict
@@ -31,26 +33,45 @@ Author: [Your Name]
 import os
 import sys
 import json
-from collections import defaultdict
+import mmap
+from collections import Counter, defaultdict
 from typing import Dict, Any
 
-def load_logical_db(design_path: str) -> dict:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _load_json(path: str) -> Any:
     """
-    Parse a mapped JSON design file and build the logical_db structure.
-    Args:
-        design_path (str): Path to mapped JSON file.
-    Returns:
-        dict: logical_db as described above.
+    Load a JSON file and return its contents.
+    Uses orjson over a read-only mmap of the file when orjson is installed,
+    falling back to the stdlib json module otherwise.
+    """
+    if orjson is None:
+        with open(path, 'r') as f:
+            return json.load(f)
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+
+def _make_net() -> dict:
+    """Return an empty net record (default factory for the nets map)."""
+    return {'drivers': [], 'loads': []}
+
+def _load_top_module(design_path: str) -> dict:
+    """
+    Load a mapped JSON design file and return its top module.
     Raises:
         Exception: On file or format errors.
     """
     if not os.path.isfile(design_path):
         raise FileNotFoundError(f"Design file not found: {design_path}")
-    with open(design_path, 'r') as f:
-        try:
-            design = json.load(f)
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse JSON: {e}")
+    try:
+        design = _load_json(design_path)
+    except Exception as e:
+        raise RuntimeError(f"Failed to parse JSON: {e}")
 
     # Find the top module (first in 'modules' or with 'top' attribute)
     modules = design.get('modules', {})
@@ -63,6 +84,19 @@ def load_logical_db(design_path: str) -> dict:
         top_mod = next(iter(modules.values()))
     if top_mod is None:
         raise ValueError("No modules found in design JSON.")
+    return top_mod
+
+def load_logical_db(design_path: str) -> dict:
+    """
+    Parse a mapped JSON design file and build the logical_db structure.
+    Args:
+        design_path (str): Path to mapped JSON file.
+    Returns:
+        dict: logical_db as described above.
+    Raises:
+        Exception: On file or format errors.
+    """
+    top_mod = _load_top_module(design_path)
 
     # Build bit index to net name mapping
     netnames = top_mod.get('netnames', {})
@@ -71,12 +105,15 @@ def load_logical_db(design_path: str) -> dict:
         for bit in netinfo.get('bits', []):
             bit_to_net[bit] = net
 
-    # Parse instances
+    # Parse instances and nets (drivers and loads) in a single pass
     instances = {}
+    nets = defaultdict(_make_net)
     cell_count_by_type = defaultdict(int)
     cells = top_mod.get('cells', {})
     for inst_name, cell in cells.items():
-        cell_type = cell.get('type', 'UNKNOWN')
+        # Interned so all instances of a type share one string object
+        cell_type = sys.intern(cell.get('type', 'UNKNOWN'))
+        port_dirs = cell.get('port_directions', {})
         connections = {}
         for port, bits in cell.get('connections', {}).items():
             if not bits:
@@ -85,22 +122,6 @@ def load_logical_db(design_path: str) -> dict:
             bit = bits[0]
             net = bit_to_net.get(bit, str(bit))
             connections[port] = net
-        instances[inst_name] = {
-            'type': cell_type,
-            'connections': connections
-        }
-        cell_count_by_type[cell_type] += 1
-
-    # Parse nets: drivers and loads
-    nets = defaultdict(lambda: {'drivers': [], 'loads': []})
-    for inst_name, cell in cells.items():
-        cell_type = cell.get('type', 'UNKNOWN')
-        port_dirs = cell.get('port_directions', {})
-        for port, bits in cell.get('connections', {}).items():
-            if not bits:
-                continue
-            bit = bits[0]
-            net = bit_to_net.get(bit, str(bit))
             direction = port_dirs.get(port, '').lower()
             if direction == 'output':
                 nets[net]['drivers'].append(f"{inst_name}.{port}")
@@ -109,6 +130,11 @@ def load_logical_db(design_path: str) -> dict:
             else:
                 # If direction unknown, treat as load (conservative)
                 nets[net]['loads'].append(f"{inst_name}.{port}")
+        instances[inst_name] = {
+            'type': cell_type,
+            'connections': connections
+        }
+        cell_count_by_type[cell_type] += 1
 
     # Add top-level ports as drivers/loads
     ports = top_mod.get('ports', {})
@@ -131,6 +157,23 @@ def load_logical_db(design_path: str) -> dict:
     }
     return logical_db
 
+def load_cell_counts(design_path: str) -> dict:
+    """
+    Count the cells of each type in a mapped JSON design file.
+    Equivalent to load_logical_db(design_path)["cell_count_by_type"], but
+    skips building instances and nets, for callers (e.g. the validator)
+    that only need the type counts.
+    Args:
+        design_path (str): Path to mapped JSON file.
+    Returns:
+        dict: {cell_type: count}
+    Raises:
+        Exception: On file or format errors.
+    """
+    top_mod = _load_top_module(design_path)
+    cells = top_mod.get('cells', {})
+    return dict(Counter(cell.get('type', 'UNKNOWN') for cell in cells.values()))
+
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Usage: python src/parse_design.py <design_json>")
@@ -24,8 +24,9 @@ Author: [Your Name]
 
 import os
 import sys
-from parse_fabric import load_fabric_db
-from parse_design import load_logical_db
+from collections import Counter
+from Parse_Fabric import load_fabric_db
+from parse_design import load_cell_counts
 
 # Cell type normalization mapping (design cell type -> fabric cell type)
 CELL_TYPE_MAP = {
@@ -48,16 +49,14 @@ def validate_fabric_vs_design(fabric_dir: str, design_path: str) -> str:
     """
     # Load databases
     fabric_db = load_fabric_db(os.path.join(fabric_dir, "fabric_cells.yaml"), os.path.join(fabric_dir, "pins.yaml"))
-    logical_db = load_logical_db(design_path)
+    logical_cells_raw = load_cell_counts(design_path)
 
     # Gather available slots by type
     fabric_slots = {k: len(v) for k, v in fabric_db.get('cells_by_type', {}).items()}
-    logical_cells_raw = logical_db.get('cell_count_by_type', {})
     # Normalize logical cell types to fabric cell types
-    logical_cells = {}
+    logical_cells = Counter()
     for cell_type, count in logical_cells_raw.items():
-        norm_type = normalize_cell_type(cell_type)
-        logical_cells[norm_type] = logical_cells.get(norm_type, 0) + count
+        logical_cells[normalize_cell_type(cell_type)] += count
 
     # Prepare report
     lines = []
@@ -81,13 +80,14 @@ def validate_fabric_vs_design(fabric_dir: str, design_path: str) -> str:
             lines.append(f"ERROR: Not enough slots for cell type '{cell_type}' (needed {used}, available {available})")
             error_found = True
     report = "\n".join(lines)
+    # Emit report and verdict with a single write
     if error_found:
-        print(report)
-        print("\n❌ Validation failed: Design does not fit on fabric.")
-        sys.exit(1)
+        status = "❌ Validation failed: Design does not fit on fabric."
     else:
-        print(report)
-        print("\n✅ Validation passed: Design is buildable on fabric.")
+        status = "✅ Validation passed: Design is buildable on fabric."
+    sys.stdout.write(f"{report}\n\n{status}\n")
+    if error_found:
+        sys.exit(1)
     return report
 
 def save_report(report: str, design_path: str):